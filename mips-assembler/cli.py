@@ -1,20 +1,58 @@
 #!/usr/bin/env python3
 import argparse
 import sys
+from array import array
+from contextlib import ExitStack
+from io import StringIO
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from mips_assembler.parser import MIPSParser
 from mips_assembler.encoder import MIPSEncoder
+from mips_assembler.listing import ListingWriter, LineTableWriter, labels_by_address
+from mips_assembler.cache import Cache, CacheConfig, CacheError, CacheProfiler
+from mips_assembler.simulator import MIPSSimulator
 
-def assemble(input_file: Path, output_file: Optional[Path] = None) -> None:
+DEFAULT_CACHE = '4096:16:2:lru'
+
+def cache_config(spec: str) -> CacheConfig:
+    """Parse a cache specification argument for argparse"""
+    try:
+        return CacheConfig.parse(spec)
+    except CacheError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def positive_int(value: str) -> int:
+    """Parse a positive integer argument for argparse"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+def assemble(input_file: Path, output_file: Optional[Path] = None,
+             listing_file: Optional[Path] = None, line_table_file: Optional[Path] = None,
+             cache_report: Optional[Path] = None, icache: Optional[CacheConfig] = None,
+             dcache: Optional[CacheConfig] = None, max_steps: int = 100_000_000) -> None:
     """
     Assemble a MIPS assembly file into machine code
     
     Args:
         input_file: Path to the input assembly file
         output_file: Path to the output machine code file (optional)
+        listing_file: Path to the address/word/source listing file (optional)
+        line_table_file: Path to the binary address-to-line table (optional)
+        cache_report: Path to write a cache behavior report to after running
+            the program (optional)
+        icache: Instruction cache configuration for the cache report
+        dcache: Data cache configuration for the cache report
+        max_steps: Maximum number of instructions to execute for the cache report
     """
+    # Streamed outputs opened so far, removed again if assembly fails part-way
+    partial_outputs: List[Path] = []
+    
     try:
         # Read input file
         with open(input_file, 'r') as f:
@@ -24,26 +62,68 @@ def assemble(input_file: Path, output_file: Optional[Path] = None) -> None:
         parser = MIPSParser()
         instructions = parser.parse(code)
         
-        # Encode the instructions
-        encoder = MIPSEncoder()
-        machine_code = encoder.encode(instructions)
+        with ExitStack() as stack:
+            def open_output(path: Path, mode: str):
+                stream = stack.enter_context(open(path, mode))
+                partial_outputs.append(path)
+                return stream
+            
+            # stdout cannot be cleaned up on failure, so it is buffered until encoding succeeds
+            out = open_output(output_file, 'w') if output_file else StringIO()
+            
+            # Listing and line table rows are written as each word is encoded
+            listing = None
+            if listing_file:
+                listing = ListingWriter(open_output(listing_file, 'w'),
+                                        stack.enter_context(open(input_file, 'r')),
+                                        labels_by_address(parser.symbol_table))
+            line_table = None
+            if line_table_file:
+                line_table = LineTableWriter(open_output(line_table_file, 'wb'))
+            
+            # Encode the instructions, keeping the words only if they will be executed
+            words = array('I')
+            encoder = MIPSEncoder()
+            for address, instruction, code in encoder.iter_encode(instructions):
+                if cache_report:
+                    words.append(code)
+                # Convert to 32-bit binary string, padded with leading zeros
+                out.write(f"{format(code, '032b')}\n")
+                if listing:
+                    listing.write(address, instruction, code)
+                if line_table:
+                    line_table.add(address, instruction.line)
+            if line_table:
+                line_table.finish()
+        partial_outputs.clear()
         
-        # Write output
         if output_file:
-            with open(output_file, 'w') as f:
-                for code in machine_code:
-                    # Convert to 32-bit binary string, padded with leading zeros
-                    binary_str = format(code, '032b')
-                    f.write(f"{binary_str}\n")
             print(f"Successfully assembled {input_file} to {output_file}")
         else:
-            # Print to stdout
-            for code in machine_code:
-                # Convert to 32-bit binary string, padded with leading zeros
-                binary_str = format(code, '032b')
-                print(binary_str)
+            sys.stdout.write(out.getvalue())
+        
+        if cache_report:
+            profiler = CacheProfiler(Cache(icache or CacheConfig.parse(DEFAULT_CACHE)),
+                                     Cache(dcache or CacheConfig.parse(DEFAULT_CACHE)),
+                                     labels_by_address(parser.symbol_table))
+            simulator = MIPSSimulator(words)
+            simulator.run(profiler, max_steps)
+            with open(cache_report, 'w') as f:
+                if simulator.halted:
+                    f.write(f"Executed {simulator.steps} instructions\n")
+                else:
+                    f.write(f"Stopped at --max-steps limit after {simulator.steps} instructions "
+                            f"(PC 0x{simulator.pc:08X}); results cover a partial run\n")
+                profiler.write_report(f)
             
     except Exception as e:
+        # Cleanup is best-effort; the original error is what gets reported
+        for path in partial_outputs:
+            try:
+                if path.is_file():
+                    path.unlink()
+            except OSError:
+                pass
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -52,6 +132,18 @@ def main():
     parser = argparse.ArgumentParser(description='MIPS Assembler')
     parser.add_argument('input', type=Path, help='Input assembly file')
     parser.add_argument('-o', '--output', type=Path, help='Output machine code file')
+    parser.add_argument('-l', '--listing', type=Path,
+                        help='Write an address/word/source/label listing file')
+    parser.add_argument('--line-table', type=Path,
+                        help='Write a binary address-to-source-line table')
+    parser.add_argument('--cache-report', type=Path,
+                        help='Run the program and write I-/D-cache hit/miss rates per label')
+    parser.add_argument('--icache', type=cache_config, default=DEFAULT_CACHE,
+                        help=f'I-cache as SIZE:LINE_SIZE:WAYS[:lru|fifo] (default {DEFAULT_CACHE})')
+    parser.add_argument('--dcache', type=cache_config, default=DEFAULT_CACHE,
+                        help=f'D-cache as SIZE:LINE_SIZE:WAYS[:lru|fifo] (default {DEFAULT_CACHE})')
+    parser.add_argument('--max-steps', type=positive_int, default=100_000_000,
+                        help='Maximum instructions to execute for --cache-report')
     parser.add_argument('-v', '--version', action='version', version='MIPS Assembler 1.0')
     
     args = parser.parse_args()
@@ -62,7 +154,8 @@ def main():
         sys.exit(1)
     
     # Assemble the code
-    assemble(args.input, args.output)
+    assemble(args.input, args.output, args.listing, args.line_table,
+             args.cache_report, args.icache, args.dcache, args.max_steps)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -0,0 +1,2 @@
+# Present so pytest puts this directory on sys.path, making the
+# mips_assembler package and the top-level cli module importable from tests/
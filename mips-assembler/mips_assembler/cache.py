@@ -0,0 +1,192 @@
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, TextIO
+
+class CacheError(Exception):
+    """Custom exception for invalid cache configurations"""
+    def __init__(self, message: str, spec: str):
+        self.message = message
+        self.spec = spec
+        super().__init__(f"{message} in cache configuration '{spec}'")
+
+@dataclass
+class CacheConfig:
+    """Geometry and replacement policy of a set-associative cache"""
+    size: int           # Total capacity in bytes
+    line_size: int      # Bytes per cache line
+    associativity: int  # Ways per set
+    policy: str = 'lru' # Replacement policy, one of CacheConfig.POLICIES
+
+    POLICIES = ('lru', 'fifo')
+
+    def __post_init__(self):
+        """Validate the cache geometry"""
+        for name in ('size', 'line_size', 'associativity'):
+            value = getattr(self, name)
+            if value <= 0 or value & (value - 1):
+                raise CacheError(f"{name} must be a positive power of two", str(self))
+        if self.size < self.line_size * self.associativity:
+            raise CacheError("size must hold at least one set", str(self))
+        if self.policy not in self.POLICIES:
+            raise CacheError(f"Unknown replacement policy: {self.policy}", str(self))
+
+    def __str__(self) -> str:
+        return f"{self.size}:{self.line_size}:{self.associativity}:{self.policy}"
+
+    @classmethod
+    def parse(cls, spec: str) -> 'CacheConfig':
+        """
+        Parse a SIZE:LINE_SIZE:ASSOCIATIVITY[:POLICY] specification
+
+        Args:
+            spec: Specification string, e.g. '4096:16:2:lru'
+
+        Returns:
+            The parsed CacheConfig
+        """
+        fields = spec.split(':')
+        if len(fields) not in (3, 4):
+            raise CacheError("Expected SIZE:LINE_SIZE:ASSOCIATIVITY[:POLICY]", spec)
+        try:
+            size, line_size, associativity = (int(field, 0) for field in fields[:3])
+        except ValueError:
+            raise CacheError("Cache dimensions must be integers", spec) from None
+        policy = fields[3].lower() if len(fields) == 4 else 'lru'
+        return cls(size, line_size, associativity, policy)
+
+class Cache:
+    """Set-associative cache model with an array-backed tag store"""
+
+    INVALID = -1
+
+    def __init__(self, config: CacheConfig):
+        """
+        Initialize an empty cache
+
+        Args:
+            config: Cache geometry and replacement policy
+        """
+        self.config = config
+        self.ways = config.associativity
+        self.sets = config.size // (config.line_size * config.associativity)
+        self.offset_bits = config.line_size.bit_length() - 1
+        self.index_bits = self.sets.bit_length() - 1
+        self.set_mask = self.sets - 1
+        self.update_on_hit = config.policy == 'lru'
+        # One slot per (set, way); stamps hold the last use (LRU) or fill (FIFO) time
+        self.tags = array('q', [self.INVALID]) * (self.sets * self.ways)
+        self.stamps = array('Q', [0]) * (self.sets * self.ways)
+        self.clock = 0
+        self.hits = 0
+        self.misses = 0
+
+    def access(self, address: int) -> bool:
+        """
+        Look up a byte address, filling the line on a miss
+
+        Args:
+            address: Byte address being accessed
+
+        Returns:
+            True on a hit, False on a miss
+        """
+        tags = self.tags
+        stamps = self.stamps
+        block = address >> self.offset_bits
+        tag = block >> self.index_bits
+        first = (block & self.set_mask) * self.ways
+        last = first + self.ways
+        self.clock += 1
+
+        for slot in range(first, last):
+            if tags[slot] == tag:
+                if self.update_on_hit:
+                    stamps[slot] = self.clock
+                self.hits += 1
+                return True
+
+        # Miss: fill an invalid way, otherwise evict the oldest stamp
+        victim = first
+        for slot in range(first, last):
+            if tags[slot] == self.INVALID:
+                victim = slot
+                break
+            if stamps[slot] < stamps[victim]:
+                victim = slot
+        tags[victim] = tag
+        stamps[victim] = self.clock
+        self.misses += 1
+        return False
+
+class CacheProfiler:
+    """Feeds simulator accesses into I- and D-caches, counting results per label region"""
+
+    NO_LABEL = '(none)'
+
+    def __init__(self, icache: Cache, dcache: Cache, labels: Dict[int, str], base_address: int = 0):
+        """
+        Initialize the profiler
+
+        Args:
+            icache: Cache receiving instruction fetches
+            dcache: Cache receiving lw/sw data accesses
+            labels: Maps byte addresses to label names; each label's region
+                extends to the next label
+            base_address: Byte address of the first instruction
+        """
+        self.icache = icache
+        self.dcache = dcache
+        self.region_starts = array('Q', [base_address])
+        self.region_names: List[str] = [self.NO_LABEL]
+        for address in sorted(labels):
+            if address == self.region_starts[-1]:
+                self.region_names[-1] = labels[address]
+            else:
+                self.region_starts.append(address)
+                self.region_names.append(labels[address])
+        regions = len(self.region_names)
+        self.fetch_hits = array('Q', [0]) * regions
+        self.fetch_misses = array('Q', [0]) * regions
+        self.data_hits = array('Q', [0]) * regions
+        self.data_misses = array('Q', [0]) * regions
+
+    def _region(self, pc: int) -> int:
+        """Index of the label region containing pc"""
+        return max(bisect_right(self.region_starts, pc) - 1, 0)
+
+    def fetch(self, pc: int) -> None:
+        """Record an instruction fetch"""
+        if self.icache.access(pc):
+            self.fetch_hits[self._region(pc)] += 1
+        else:
+            self.fetch_misses[self._region(pc)] += 1
+
+    def data_access(self, pc: int, address: int, is_store: bool) -> None:
+        """Record a data access, attributed to the region of the issuing instruction"""
+        if self.dcache.access(address):
+            self.data_hits[self._region(pc)] += 1
+        else:
+            self.data_misses[self._region(pc)] += 1
+
+    def write_report(self, stream: TextIO) -> None:
+        """Write per-region and total hit/miss counts"""
+        stream.write(f"I-cache {self.icache.config}  D-cache {self.dcache.config}\n")
+        stream.write(f"{'REGION':<16}  {'I-ACCESS':>10}  {'I-MISS':>10}  {'I-MISS%':>7}  "
+                     f"{'D-ACCESS':>10}  {'D-MISS':>10}  {'D-MISS%':>7}\n")
+        # Regions that were never reached are skipped; the total is always written
+        rows = [(name, self.fetch_hits[i], self.fetch_misses[i], self.data_hits[i], self.data_misses[i])
+                for i, name in enumerate(self.region_names)
+                if self.fetch_hits[i] or self.fetch_misses[i] or self.data_hits[i] or self.data_misses[i]]
+        rows.append(('TOTAL', self.icache.hits, self.icache.misses, self.dcache.hits, self.dcache.misses))
+        for name, fetch_hits, fetch_misses, data_hits, data_misses in rows:
+            fetches = fetch_hits + fetch_misses
+            accesses = data_hits + data_misses
+            stream.write(f"{name:<16}  {fetches:>10}  {fetch_misses:>10}  "
+                         f"{self._rate(fetch_misses, fetches):>7}  {accesses:>10}  "
+                         f"{data_misses:>10}  {self._rate(data_misses, accesses):>7}\n")
+
+    @staticmethod
+    def _rate(misses: int, accesses: int) -> str:
+        """Format a miss rate as a percentage"""
+        return f"{100.0 * misses / accesses:.2f}" if accesses else '-'
@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Tuple
 from .parser import Instruction, RTypeInstruction, ITypeInstruction, JTypeInstruction
 
 class EncoderError(Exception):
@@ -37,6 +37,7 @@ class MIPSEncoder:
         # R-type instructions
         'add': 0x00, 'sub': 0x00, 'and': 0x00, 'or': 0x00,
         'slt': 0x00, 'sll': 0x00, 'srl': 0x00, 'nop': 0x00,
+        'jr': 0x00,
         
         # I-type instructions
         'addi': 0x08, 'lw': 0x23, 'sw': 0x2B,
@@ -49,7 +50,8 @@ class MIPSEncoder:
     # Function codes for R-type instructions
     FUNCTS: Dict[str, int] = {
         'add': 0x20, 'sub': 0x22, 'and': 0x24, 'or': 0x25,
-        'slt': 0x2A, 'sll': 0x00, 'srl': 0x02, 'nop': 0x00
+        'slt': 0x2A, 'sll': 0x00, 'srl': 0x02, 'nop': 0x00,
+        'jr': 0x08
     }
 
     def __init__(self):
@@ -66,7 +68,24 @@ class MIPSEncoder:
         Returns:
             List of 32-bit machine code instructions
         """
-        return [self._encode_instruction(instr) for instr in instructions]
+        return [word for _, _, word in self.iter_encode(instructions)]
+
+    def iter_encode(self, instructions: Iterable[Instruction],
+                    base_address: int = 0) -> Iterator[Tuple[int, Instruction, int]]:
+        """
+        Lazily encode instructions, yielding one result per instruction
+        
+        Args:
+            instructions: Iterable of Instruction objects
+            base_address: Byte address of the first instruction
+            
+        Yields:
+            Tuples of (byte address, instruction, 32-bit machine code)
+        """
+        address = base_address
+        for instr in instructions:
+            yield address, instr, self._encode_instruction(instr)
+            address += 4
 
     def _encode_instruction(self, instruction: Instruction) -> int:
         """
@@ -93,9 +112,9 @@ class MIPSEncoder:
         funct = self.FUNCTS[instruction.mnemonic]
         
         # Get register numbers
-        rd = self._get_register_number(instruction.rd)
-        rs = self._get_register_number(instruction.rs) if instruction.rs else 0
-        rt = self._get_register_number(instruction.rt) if instruction.rt else 0
+        rd = self._get_register_number(instruction.rd, instruction)
+        rs = self._get_register_number(instruction.rs, instruction) if instruction.rs else 0
+        rt = self._get_register_number(instruction.rt, instruction) if instruction.rt else 0
         
         # Handle special cases
         if instruction.mnemonic in ['sll', 'srl']:
@@ -109,8 +128,8 @@ class MIPSEncoder:
     def _encode_i_type(self, instruction: ITypeInstruction) -> int:
         """Encode an I-type instruction"""
         opcode = self.OPCODES[instruction.mnemonic]
-        rt = self._get_register_number(instruction.rt)
-        rs = self._get_register_number(instruction.rs)
+        rt = self._get_register_number(instruction.rt, instruction)
+        rs = self._get_register_number(instruction.rs, instruction)
         
         # Handle different immediate formats
         if instruction.mnemonic in ['lw', 'sw']:
@@ -139,10 +158,10 @@ class MIPSEncoder:
         
         return (opcode << 26) | target
 
-    def _get_register_number(self, reg: str) -> int:
+    def _get_register_number(self, reg: str, instruction: Instruction) -> int:
         """Get the register number from a register name"""
         if reg not in self.REGISTERS:
-            raise EncoderError(f"Invalid register: {reg}", None)
+            raise EncoderError(f"Invalid register: {reg}", instruction)
         return self.REGISTERS[reg]
 
 # Example usage
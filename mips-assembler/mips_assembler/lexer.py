@@ -23,7 +23,7 @@ class MIPSLexer:
     # List of known MIPS instructions
     INSTRUCTIONS = {
         'add', 'sub', 'and', 'or', 'slt', 'sll', 'srl', 'nop',
-        'addi', 'lw', 'sw', 'beq', 'bne', 'j', 'jal'
+        'addi', 'lw', 'sw', 'beq', 'bne', 'j', 'jal', 'jr'
     }
     
     def __init__(self):
@@ -46,7 +46,7 @@ class MIPSLexer:
         """Check if a character is a digit"""
         return char.isdigit() or char == '-'
 
-    def _get_next_token(self, text: str, pos: int, line: int) -> tuple[Optional[Token], int]:
+    def _get_next_token(self, text: str, pos: int, line: int) -> tuple[Optional[Token], int, int]:
         """
         Get the next token from the text starting at pos
         
@@ -56,7 +56,8 @@ class MIPSLexer:
             line: Current line number
             
         Returns:
-            Tuple of (Token, new_position) or (None, new_position) if no token found
+            Tuple of (Token, new_position, new_line) or (None, new_position, new_line)
+            if no token found
         """
         # Skip whitespace
         while pos < len(text) and self._is_whitespace(text[pos]):
@@ -65,7 +66,7 @@ class MIPSLexer:
             pos += 1
         
         if pos >= len(text):
-            return None, pos
+            return None, pos, line
             
         char = text[pos]
         start_pos = pos
@@ -74,40 +75,40 @@ class MIPSLexer:
         if char == '#':
             while pos < len(text) and text[pos] != '\n':
                 pos += 1
-            return None, pos
+            return None, pos, line
             
         # Handle labels
         if self._is_alpha(char):
             while pos < len(text) and self._is_alnum(text[pos]):
                 pos += 1
             if pos < len(text) and text[pos] == ':':
-                return Token('LABEL', text[start_pos:pos], line, start_pos + 1), pos + 1
+                return Token('LABEL_DEF', text[start_pos:pos], line, start_pos + 1), pos + 1, line
             value = text[start_pos:pos]
             if value in self.INSTRUCTIONS:
-                return Token('INSTR', value, line, start_pos + 1), pos
-            return Token('IDENT', value, line, start_pos + 1), pos
+                return Token('INSTR', value, line, start_pos + 1), pos, line
+            return Token('IDENT', value, line, start_pos + 1), pos, line
             
         # Handle registers
         if char == '$':
             pos += 1
             while pos < len(text) and self._is_alnum(text[pos]):
                 pos += 1
-            return Token('REG', text[start_pos:pos], line, start_pos + 1), pos
+            return Token('REG', text[start_pos:pos], line, start_pos + 1), pos, line
             
         # Handle numbers
         if self._is_digit(char):
             pos += 1
             while pos < len(text) and text[pos].isdigit():
                 pos += 1
-            return Token('NUM', text[start_pos:pos], line, start_pos + 1), pos
+            return Token('NUM', text[start_pos:pos], line, start_pos + 1), pos, line
             
         # Handle single-character tokens
         if char == ',':
-            return Token('COMMA', ',', line, start_pos + 1), pos + 1
+            return Token('COMMA', ',', line, start_pos + 1), pos + 1, line
         if char == '(':
-            return Token('LPAREN', '(', line, start_pos + 1), pos + 1
+            return Token('LPAREN', '(', line, start_pos + 1), pos + 1, line
         if char == ')':
-            return Token('RPAREN', ')', line, start_pos + 1), pos + 1
+            return Token('RPAREN', ')', line, start_pos + 1), pos + 1, line
             
         # If we get here, we have an invalid character
         raise LexerError(f"Invalid character: {char}", line, start_pos + 1)
@@ -126,14 +127,12 @@ class MIPSLexer:
         line = 1
         
         while pos < len(text):
-            token, pos = self._get_next_token(text, pos, line)
+            token, pos, line = self._get_next_token(text, pos, line)
             if token:
                 # Convert IDENT to LABEL if it's a branch target
                 if token.type == 'IDENT' and token.value not in self.INSTRUCTIONS:
                     token = Token('LABEL', token.value, token.line, token.column)
                 yield token
-                if token.type == 'LABEL':
-                    line = token.line
 
     def get_tokens(self, text: str) -> List[Token]:
         """
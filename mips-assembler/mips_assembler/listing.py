@@ -0,0 +1,203 @@
+from array import array
+from bisect import bisect_right
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+from .parser import Instruction
+
+class LineTableError(Exception):
+    """Custom exception for malformed line tables"""
+    def __init__(self, message: str, offset: int):
+        self.message = message
+        self.offset = offset
+        super().__init__(f"{message} at byte offset {offset}")
+
+def labels_by_address(symbol_table: Dict[str, int], base_address: int = 0) -> Dict[int, str]:
+    """
+    Invert a parser symbol table into a byte address -> label mapping
+
+    Args:
+        symbol_table: Maps label names to instruction indices
+        base_address: Byte address of the first instruction
+
+    Returns:
+        Dictionary mapping byte addresses to the first label defined there
+    """
+    labels: Dict[int, str] = {}
+    for name, index in symbol_table.items():
+        labels.setdefault(base_address + index * 4, name)
+    return labels
+
+class ListingWriter:
+    """Streams an address / machine code / source listing as instructions are encoded"""
+
+    HEADER = f"{'ADDRESS':<10}  {'WORD':<10}  {'LINE':>5}  {'LABEL':<16}  SOURCE\n"
+
+    def __init__(self, stream: TextIO, source: Iterable[str], labels: Dict[int, str]):
+        """
+        Initialize the listing writer
+
+        Args:
+            stream: Text stream the listing rows are written to
+            source: Source lines, consumed lazily in ascending line order
+            labels: Maps byte addresses to label names
+        """
+        self.stream = stream
+        self.source: Iterator[str] = iter(source)
+        self.labels = labels
+        self.source_line_number: int = 0
+        self.source_line: str = ''
+        self.current_label: str = ''
+        self.stream.write(self.HEADER)
+
+    def _get_source_line(self, line: int) -> str:
+        """Advance the source cursor to the given line and return its text"""
+        while self.source_line_number < line:
+            self.source_line = next(self.source, '')
+            self.source_line_number += 1
+        return self.source_line.strip()
+
+    def write(self, address: int, instruction: Instruction, word: int) -> None:
+        """Write the listing row for a single encoded instruction"""
+        self.current_label = self.labels.get(address, self.current_label)
+        source = self._get_source_line(instruction.line)
+        self.stream.write(f"0x{address:08X}  0x{word:08X}  {instruction.line:>5}  "
+                          f"{self.current_label:<16}  {source}\n")
+
+class LineTableWriter:
+    """
+    Streams a compact address -> source line table
+
+    The table is the MAGIC header followed by one entry per run of
+    instructions sharing a source line. Each entry is the word delta from
+    the previous entry's address as an unsigned LEB128 varint, followed by
+    the zigzag-encoded line delta as a varint. finish() appends a final
+    entry with line 0 at the address just past the last word.
+    """
+
+    MAGIC = b'MLT\x01'
+
+    def __init__(self, stream: BinaryIO):
+        """Initialize the writer and emit the table header"""
+        self.stream = stream
+        self.last_address: int = 0
+        self.last_line: int = 0
+        self.end_address: int = 0
+        self.entries: int = 0
+        self.stream.write(self.MAGIC)
+
+    @staticmethod
+    def _encode_varint(value: int) -> bytes:
+        """Encode a non-negative integer as an unsigned LEB128 varint"""
+        out = bytearray()
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+        return bytes(out)
+
+    def add(self, address: int, line: int) -> None:
+        """Record that the word at address was assembled from the given source line"""
+        if address & 0x3 or address < self.end_address:
+            raise ValueError(f"Addresses must be word aligned and ascending: 0x{address:08X}")
+        if line <= 0:
+            raise ValueError(f"Source lines must be positive: {line}")
+        self.end_address = address + 4
+        if self.entries and line == self.last_line:
+            return
+        self._write_entry(address, line)
+
+    def finish(self) -> None:
+        """Write the end marker; call once after the last word has been added"""
+        self._write_entry(self.end_address, 0)
+
+    def _write_entry(self, address: int, line: int) -> None:
+        """Append one delta-encoded entry"""
+        line_delta = line - self.last_line
+        zigzag = line_delta * 2 if line_delta >= 0 else -line_delta * 2 - 1
+        self.stream.write(self._encode_varint((address - self.last_address) >> 2)
+                          + self._encode_varint(zigzag))
+        self.last_address = address
+        self.last_line = line
+        self.entries += 1
+
+class LineTable:
+    """Loaded address -> source line table, queried by binary search"""
+
+    def __init__(self, addresses: array, lines: array, end_address: int):
+        """
+        Initialize the table
+
+        Args:
+            addresses: Ascending byte addresses where each line run starts
+            lines: Source line for each run
+            end_address: Byte address just past the last word
+        """
+        self.addresses = addresses
+        self.lines = lines
+        self.end_address = end_address
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'LineTable':
+        """Decode a table produced by LineTableWriter"""
+        if data[:len(LineTableWriter.MAGIC)] != LineTableWriter.MAGIC:
+            raise LineTableError("Bad line table header", 0)
+        addresses = array('I')
+        lines = array('I')
+        address = 0
+        line = 0
+        pos = len(LineTableWriter.MAGIC)
+        while pos < len(data):
+            address_delta, pos = cls._read_varint(data, pos)
+            zigzag, pos = cls._read_varint(data, pos)
+            address += address_delta << 2
+            line += (zigzag >> 1) ^ -(zigzag & 1)
+            if line == 0:
+                if pos != len(data):
+                    raise LineTableError("Data after end marker", pos)
+                return cls(addresses, lines, address)
+            if line < 0:
+                raise LineTableError("Negative source line", pos)
+            addresses.append(address)
+            lines.append(line)
+        raise LineTableError("Missing end marker", pos)
+
+    @classmethod
+    def load(cls, stream: BinaryIO) -> 'LineTable':
+        """Read and decode a table from a binary stream"""
+        return cls.from_bytes(stream.read())
+
+    @staticmethod
+    def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+        """Decode an unsigned LEB128 varint, returning (value, new_position)"""
+        value = 0
+        shift = 0
+        while pos < len(data):
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value, pos
+        raise LineTableError("Truncated line table entry", pos)
+
+    def lookup(self, address: int) -> Optional[int]:
+        """
+        Find the source line for a byte address
+
+        Args:
+            address: Byte address of an assembled word
+
+        Returns:
+            The source line, or None if the address is outside the program
+        """
+        if address >= self.end_address:
+            return None
+        index = bisect_right(self.addresses, address) - 1
+        if index < 0:
+            return None
+        return self.lines[index]
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.addresses, self.lines)
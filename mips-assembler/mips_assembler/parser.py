@@ -51,6 +51,7 @@ class MIPSParser:
         'sll': ('R', 0x00),  # shamt = 0x00
         'srl': ('R', 0x02),  # shamt = 0x02
         'nop': ('R', 0x00),  # nop is sll $zero, $zero, 0
+        'jr':  ('R', 0x08),  # funct = 0x08
         
         # I-type instructions
         'addi': ('I', None),
@@ -90,7 +91,7 @@ class MIPSParser:
         self.current_instruction_index = 0
         
         while self.current_token:
-            if self.current_token.type == 'LABEL':
+            if self.current_token.type == 'LABEL_DEF':
                 # Store label position in symbol table
                 self.symbol_table[self.current_token.value] = self.current_instruction_index
                 self.advance()
@@ -107,8 +108,8 @@ class MIPSParser:
         
         instructions = []
         while self.current_token:
-            if self.current_token.type == 'LABEL':
-                # Skip labels (already processed in first pass)
+            if self.current_token.type == 'LABEL_DEF':
+                # Skip label definitions (already processed in first pass)
                 self.advance()
             elif self.current_token.type == 'INSTR':
                 instruction = self.parse_instruction()
@@ -165,6 +166,10 @@ class MIPSParser:
             self.expect_token('COMMA')
             shamt = self.expect_token('NUM').value
             return RTypeInstruction(mnemonic, line, column, rd, None, rt, shamt, funct)
+        elif mnemonic == 'jr':
+            # jr only names the register holding the return address
+            rs = self.expect_token('REG').value
+            return RTypeInstruction(mnemonic, line, column, '$zero', rs, '$zero', None, funct)
         else:
             # Standard R-type format
             rd = self.expect_token('REG').value
@@ -189,9 +194,10 @@ class MIPSParser:
             # Branch instructions use a label as immediate
             rs = self.expect_token('REG').value
             self.expect_token('COMMA')
-            label = self.expect_token('LABEL').value
+            label_token = self.expect_token('LABEL')
+            label = label_token.value
             if label not in self.symbol_table:
-                raise ParserError(f"Undefined label: {label}", self.current_token)
+                raise ParserError(f"Undefined label: {label}", label_token)
             # Calculate branch offset (number of instructions to jump)
             target_index = self.symbol_table[label]
             offset = target_index - (self.current_instruction_index + 1)  # +1 because PC is incremented
@@ -206,11 +212,12 @@ class MIPSParser:
 
     def parse_j_type(self, mnemonic: str, line: int, column: int) -> JTypeInstruction:
         """Parse a J-type instruction"""
-        label = self.expect_token('LABEL').value
+        label_token = self.expect_token('LABEL')
+        label = label_token.value
         if label not in self.symbol_table:
-            raise ParserError(f"Undefined label: {label}", self.current_token)
-        # For J-type, we store the target instruction index
-        return JTypeInstruction(mnemonic, line, column, str(self.symbol_table[label]))
+            raise ParserError(f"Undefined label: {label}", label_token)
+        # For J-type, we store the target byte address (instructions are 4 bytes)
+        return JTypeInstruction(mnemonic, line, column, str(self.symbol_table[label] * 4))
 
     def expect_token(self, expected_type: str) -> Token:
         """Expect a specific token type and return it, or raise an error"""
@@ -0,0 +1,140 @@
+from array import array
+from typing import Dict, Iterable, Optional, Protocol
+
+class SimulatorError(Exception):
+    """Custom exception for simulator errors"""
+    def __init__(self, message: str, pc: int):
+        self.message = message
+        self.pc = pc
+        super().__init__(f"{message} at address 0x{pc:08X}")
+
+class AccessObserver(Protocol):
+    """Receives the memory accesses made while a program runs"""
+
+    def fetch(self, pc: int) -> None:
+        """Called for every instruction fetch"""
+
+    def data_access(self, pc: int, address: int, is_store: bool) -> None:
+        """Called for every lw/sw issued by the instruction at pc"""
+
+class MIPSSimulator:
+    """Executes assembled MIPS machine code words"""
+
+    # Initial stack and global pointers, following the usual MIPS memory layout
+    STACK_POINTER = 0x7FFFEFFC
+    GLOBAL_POINTER = 0x10008000
+
+    def __init__(self, words: Iterable[int], base_address: int = 0):
+        """
+        Initialize the simulator
+
+        Args:
+            words: 32-bit machine code words, loaded contiguously
+            base_address: Byte address of the first word
+        """
+        self.words = array('I', words)
+        self.base_address = base_address
+        self.registers = [0] * 32
+        self.registers[28] = self.GLOBAL_POINTER
+        self.registers[29] = self.STACK_POINTER
+        self.memory: Dict[int, int] = {}  # Sparse data memory, keyed by word-aligned byte address
+        self.pc = base_address
+        self.steps = 0
+        self.halted = False  # Set once the PC leaves the program
+
+    def run(self, observer: Optional[AccessObserver] = None, max_steps: int = 100_000_000) -> int:
+        """
+        Execute until the PC leaves the program or max_steps is reached
+
+        Args:
+            observer: Optional receiver for instruction fetches and data accesses
+            max_steps: Maximum number of instructions to execute
+
+        Returns:
+            Number of instructions executed
+        """
+        words = self.words
+        regs = self.registers
+        memory = self.memory
+        base = self.base_address
+        end = base + len(words) * 4
+        pc = self.pc
+        steps = 0
+
+        while base <= pc < end and steps < max_steps:
+            if observer:
+                observer.fetch(pc)
+            word = words[(pc - base) >> 2]
+            next_pc = (pc + 4) & 0xFFFFFFFF
+            opcode = word >> 26
+            rs = (word >> 21) & 0x1F
+            rt = (word >> 16) & 0x1F
+
+            if opcode == 0x00:
+                rd = (word >> 11) & 0x1F
+                funct = word & 0x3F
+                if funct == 0x20:    # add
+                    value = regs[rs] + regs[rt]
+                elif funct == 0x22:  # sub
+                    value = regs[rs] - regs[rt]
+                elif funct == 0x24:  # and
+                    value = regs[rs] & regs[rt]
+                elif funct == 0x25:  # or
+                    value = regs[rs] | regs[rt]
+                elif funct == 0x2A:  # slt
+                    value = int(self._signed(regs[rs]) < self._signed(regs[rt]))
+                elif funct == 0x00:  # sll / nop
+                    value = regs[rt] << ((word >> 6) & 0x1F)
+                elif funct == 0x02:  # srl
+                    value = regs[rt] >> ((word >> 6) & 0x1F)
+                elif funct == 0x08:  # jr
+                    next_pc = regs[rs]
+                    rd = 0
+                    value = 0
+                else:
+                    raise SimulatorError(f"Unknown function code: 0x{funct:02X}", pc)
+                if rd:
+                    regs[rd] = value & 0xFFFFFFFF
+            elif opcode in (0x02, 0x03):  # j / jal
+                if opcode == 0x03:
+                    regs[31] = next_pc
+                next_pc = (next_pc & 0xF0000000) | ((word & 0x3FFFFFF) << 2)
+            else:
+                immediate = word & 0xFFFF
+                if immediate & 0x8000:
+                    immediate -= 0x10000
+                if opcode == 0x08:  # addi
+                    if rt:
+                        regs[rt] = (regs[rs] + immediate) & 0xFFFFFFFF
+                elif opcode in (0x23, 0x2B):  # lw / sw
+                    address = (regs[rs] + immediate) & 0xFFFFFFFF
+                    if address & 0x3:
+                        raise SimulatorError(f"Unaligned memory access: 0x{address:08X}", pc)
+                    is_store = opcode == 0x2B
+                    if observer:
+                        observer.data_access(pc, address, is_store)
+                    if is_store:
+                        memory[address] = regs[rt]
+                    elif rt:
+                        regs[rt] = memory.get(address, 0)
+                elif opcode == 0x04:  # beq
+                    if regs[rs] == regs[rt]:
+                        next_pc = (next_pc + (immediate << 2)) & 0xFFFFFFFF
+                elif opcode == 0x05:  # bne
+                    if regs[rs] != regs[rt]:
+                        next_pc = (next_pc + (immediate << 2)) & 0xFFFFFFFF
+                else:
+                    raise SimulatorError(f"Unknown opcode: 0x{opcode:02X}", pc)
+
+            pc = next_pc
+            steps += 1
+
+        self.pc = pc
+        self.steps += steps
+        self.halted = not base <= pc < end
+        return steps
+
+    @staticmethod
+    def _signed(value: int) -> int:
+        """Interpret a 32-bit register value as a signed integer"""
+        return value - 0x100000000 if value & 0x80000000 else value
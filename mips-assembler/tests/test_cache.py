@@ -0,0 +1,93 @@
+import unittest
+from io import StringIO
+
+from mips_assembler.cache import Cache, CacheConfig, CacheError, CacheProfiler
+
+def run(config, addresses):
+    """Access each address in turn, returning the hit/miss sequence"""
+    cache = Cache(config)
+    return [cache.access(address) for address in addresses]
+
+class TestCacheConfig(unittest.TestCase):
+    """Tests for cache configuration validation and parsing"""
+
+    def test_parse(self):
+        self.assertEqual(CacheConfig.parse('4096:16:2'), CacheConfig(4096, 16, 2, 'lru'))
+        self.assertEqual(CacheConfig.parse('0x400:32:4:FIFO'), CacheConfig(1024, 32, 4, 'fifo'))
+
+    def test_power_of_two(self):
+        for args in ((100, 16, 2), (4096, 24, 2), (4096, 16, 3), (4096, 0, 2)):
+            with self.subTest(args=args):
+                with self.assertRaisesRegex(CacheError, "must be a positive power of two"):
+                    CacheConfig(*args)
+
+    def test_at_least_one_set(self):
+        with self.assertRaisesRegex(CacheError, "size must hold at least one set"):
+            CacheConfig(16, 16, 2)
+
+    def test_unknown_policy(self):
+        with self.assertRaisesRegex(CacheError, "Unknown replacement policy: random"):
+            CacheConfig(64, 16, 2, 'random')
+
+    def test_malformed_spec(self):
+        for spec in ('4096:16', 'big:16:2'):
+            with self.subTest(spec=spec):
+                with self.assertRaises(CacheError):
+                    CacheConfig.parse(spec)
+
+class TestReplacement(unittest.TestCase):
+    """Tests for LRU and FIFO replacement in a single 2-way set"""
+
+    SEQUENCE = [0, 16, 0, 32, 16]
+
+    def test_lru(self):
+        self.assertEqual(run(CacheConfig(32, 16, 2, 'lru'), self.SEQUENCE),
+                         [False, False, True, False, False])
+
+    def test_fifo(self):
+        self.assertEqual(run(CacheConfig(32, 16, 2, 'fifo'), self.SEQUENCE),
+                         [False, False, True, False, True])
+
+    def test_sets_are_independent(self):
+        # Two sets of one way each: lines 0 and 16 map to different sets
+        self.assertEqual(run(CacheConfig(32, 16, 1), [0, 16, 4, 20, 32, 16, 0]),
+                         [False, False, True, True, False, True, False])
+
+    def test_counters(self):
+        cache = Cache(CacheConfig(32, 16, 2))
+        for address in self.SEQUENCE:
+            cache.access(address)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+class TestCacheProfiler(unittest.TestCase):
+    """Tests for per-label attribution"""
+
+    def test_regions(self):
+        profiler = CacheProfiler(Cache(CacheConfig(64, 16, 1)), Cache(CacheConfig(64, 16, 1)),
+                                 {0x8: 'loop', 0x10: 'done'})
+        for pc in (0x0, 0x4, 0x8, 0xC, 0x8, 0xC, 0x10):
+            profiler.fetch(pc)
+        profiler.data_access(0xC, 0x1000, False)
+        profiler.data_access(0xC, 0x1000, True)
+
+        self.assertEqual(profiler.region_names, ['(none)', 'loop', 'done'])
+        self.assertEqual(list(profiler.fetch_hits), [1, 4, 0])
+        self.assertEqual(list(profiler.fetch_misses), [1, 0, 1])
+        self.assertEqual(list(profiler.data_hits), [0, 1, 0])
+        self.assertEqual(list(profiler.data_misses), [0, 1, 0])
+
+        report = StringIO()
+        profiler.write_report(report)
+        total = report.getvalue().splitlines()[-1].split()
+        self.assertEqual(total, ['TOTAL', '7', '2', '28.57', '2', '1', '50.00'])
+
+    def test_empty_report_has_total(self):
+        profiler = CacheProfiler(Cache(CacheConfig(64, 16, 1)), Cache(CacheConfig(64, 16, 1)), {})
+        report = StringIO()
+        profiler.write_report(report)
+        rows = report.getvalue().splitlines()
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[-1].split(), ['TOTAL', '0', '0', '-', '0', '0', '-'])
+
+if __name__ == '__main__':
+    unittest.main()
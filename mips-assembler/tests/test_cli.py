@@ -0,0 +1,95 @@
+import argparse
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from cli import assemble, positive_int
+
+class TestAssemble(unittest.TestCase):
+    """Tests for the assemble entry point"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_failed_encoding_removes_partial_outputs(self):
+        source = self.dir / 'bad.asm'
+        source.write_text("nop\nadd $t0, $t1, $bogus\n")
+        outputs = [self.dir / 'bad.bin', self.dir / 'bad.lst', self.dir / 'bad.mlt']
+
+        stderr = StringIO()
+        with redirect_stderr(stderr), self.assertRaises(SystemExit):
+            assemble(source, *outputs)
+
+        self.assertIn("Invalid register: $bogus for instruction at line 2", stderr.getvalue())
+        for path in outputs:
+            self.assertFalse(path.exists(), path)
+
+    def test_failed_encoding_prints_nothing_to_stdout(self):
+        source = self.dir / 'bad.asm'
+        source.write_text("nop\nadd $t0, $t1, $bogus\n")
+
+        stdout = StringIO()
+        with redirect_stdout(stdout), redirect_stderr(StringIO()), self.assertRaises(SystemExit):
+            assemble(source)
+
+        self.assertEqual(stdout.getvalue(), '')
+
+    def test_stdout_output(self):
+        source = self.dir / 'good.asm'
+        source.write_text("nop\njr $ra\n")
+
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            assemble(source)
+
+        self.assertEqual(stdout.getvalue(), f"{0:032b}\n{0x03E00008:032b}\n")
+
+    def test_failed_open_keeps_existing_file(self):
+        source = self.dir / 'good.asm'
+        source.write_text("nop\n")
+        listing = self.dir / 'old.lst'
+        listing.write_text("previous listing\n")
+
+        def deny_listing(path, *args, **kwargs):
+            if Path(path) == listing:
+                raise PermissionError(13, "Permission denied", str(path))
+            return open(path, *args, **kwargs)
+
+        with redirect_stderr(StringIO()), self.assertRaises(SystemExit), \
+                mock.patch('cli.open', side_effect=deny_listing, create=True):
+            assemble(source, self.dir / 'good.bin', listing)
+
+        self.assertEqual(listing.read_text(), "previous listing\n")
+        self.assertFalse((self.dir / 'good.bin').exists())
+
+    def test_failed_cleanup_still_reports_error(self):
+        source = self.dir / 'bad.asm'
+        source.write_text("nop\nadd $t0, $t1, $bogus\n")
+        output = self.dir / 'bad.bin'
+
+        stderr = StringIO()
+        with redirect_stderr(stderr), self.assertRaises(SystemExit), \
+                mock.patch.object(Path, 'unlink', side_effect=PermissionError(13, "Permission denied")):
+            assemble(source, output)
+
+        self.assertIn("Error: Invalid register: $bogus", stderr.getvalue())
+
+class TestArguments(unittest.TestCase):
+    """Tests for argument type checks"""
+
+    def test_positive_int(self):
+        self.assertEqual(positive_int('100'), 100)
+        for value in ('0', '-5', 'many'):
+            with self.subTest(value=value):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    positive_int(value)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from mips_assembler.encoder import MIPSEncoder
+from mips_assembler.parser import MIPSParser
+
+def encode(code):
+    """Assemble source text into machine code words"""
+    return MIPSEncoder().encode(MIPSParser().parse(code))
+
+class TestEncoding(unittest.TestCase):
+    """Tests for instruction encodings"""
+
+    def test_jr(self):
+        self.assertEqual(encode("jr $ra\n"), [0x03E00008])
+
+    def test_jump_targets_are_word_addresses(self):
+        # j to instruction index 2, byte address 8, encodes target field 2
+        self.assertEqual(encode("nop\nj end\nend: nop\n")[1], 0x08000002)
+        self.assertEqual(encode("nop\njal end\nend: nop\n")[1], 0x0C000002)
+
+    def test_branch_offsets(self):
+        words = encode("loop: nop\nbne $t0, $zero, loop\nbeq $t0, $zero, done\nnop\ndone: nop\n")
+        # The parser places a branch's first register in the rt field
+        self.assertEqual(words[1], 0x1408FFFE)  # Back two words from PC + 4
+        self.assertEqual(words[2], 0x10080001)  # Forward one word from PC + 4
+
+if __name__ == '__main__':
+    unittest.main()
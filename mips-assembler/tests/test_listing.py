@@ -0,0 +1,85 @@
+import unittest
+from io import BytesIO, StringIO
+
+from mips_assembler.listing import (LineTable, LineTableError, LineTableWriter,
+                                    ListingWriter, labels_by_address)
+from mips_assembler.parser import MIPSParser
+
+def write_table(rows):
+    """Write (address, line) rows to an in-memory line table"""
+    stream = BytesIO()
+    writer = LineTableWriter(stream)
+    for address, line in rows:
+        writer.add(address, line)
+    writer.finish()
+    return stream.getvalue()
+
+class TestLineTable(unittest.TestCase):
+    """Tests for writing and loading address -> line tables"""
+
+    # Lines go up, back down (negative deltas) and repeat across consecutive words
+    ROWS = [(0x00, 5), (0x04, 6), (0x08, 6), (0x0C, 2), (0x10, 300), (0x200, 1), (0x204, 1)]
+
+    def test_round_trip(self):
+        table = LineTable.load(BytesIO(write_table(self.ROWS)))
+        for address, line in self.ROWS:
+            self.assertEqual(table.lookup(address), line)
+        self.assertEqual(table.lookup(0x14), 300)  # Inside a run spanning a gap
+        self.assertEqual(table.end_address, 0x208)
+        self.assertIsNone(table.lookup(0x208))
+        self.assertIsNone(table.lookup(-4))
+        # Repeated lines on consecutive words share one entry
+        self.assertEqual(list(table), [(0x00, 5), (0x04, 6), (0x0C, 2), (0x10, 300), (0x200, 1)])
+
+    def test_empty_table(self):
+        table = LineTable.from_bytes(write_table([]))
+        self.assertEqual(len(table), 0)
+        self.assertIsNone(table.lookup(0))
+
+    def test_writer_rejects_bad_rows(self):
+        writer = LineTableWriter(BytesIO())
+        writer.add(0x08, 1)
+        with self.assertRaises(ValueError):
+            writer.add(0x04, 2)
+        with self.assertRaises(ValueError):
+            writer.add(0x0E, 2)
+        with self.assertRaises(ValueError):
+            writer.add(0x0C, 0)
+
+    def test_bad_header(self):
+        with self.assertRaisesRegex(LineTableError, "Bad line table header at byte offset 0"):
+            LineTable.from_bytes(b'XXXX' + write_table(self.ROWS)[4:])
+
+    def test_truncated_entry(self):
+        data = write_table(self.ROWS)
+        with self.assertRaisesRegex(LineTableError, "Truncated line table entry"):
+            # The last multi-byte varint (line 300) cut after its continuation byte
+            LineTable.from_bytes(data[:data.index(bytes([0xD4, 0x04])) + 1])
+
+    def test_missing_end_marker(self):
+        data = write_table(self.ROWS)
+        with self.assertRaisesRegex(LineTableError, "Missing end marker"):
+            LineTable.from_bytes(data[:-2])
+
+    def test_data_after_end_marker(self):
+        with self.assertRaisesRegex(LineTableError, "Data after end marker"):
+            LineTable.from_bytes(write_table(self.ROWS) + b'\x01\x02')
+
+class TestListingWriter(unittest.TestCase):
+    """Tests for streamed listings"""
+
+    def test_rows(self):
+        code = "main: addi $t0, $zero, 1\n\nloop: add $t0, $t0, $t0\n      j loop\n"
+        parser = MIPSParser()
+        instructions = parser.parse(code)
+        stream = StringIO()
+        listing = ListingWriter(stream, StringIO(code), labels_by_address(parser.symbol_table))
+        for address, (instruction, word) in enumerate(zip(instructions, [1, 2, 3])):
+            listing.write(address * 4, instruction, word)
+        rows = stream.getvalue().splitlines()
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[1].split()[:4], ['0x00000000', '0x00000001', '1', 'main'])
+        self.assertEqual(rows[3].split(), ['0x00000008', '0x00000003', '4', 'loop', 'j', 'loop'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+
+from mips_assembler.parser import MIPSParser, ParserError
+
+class TestLabels(unittest.TestCase):
+    """Tests for label definitions and references"""
+
+    def test_definition_after_operandless_instruction(self):
+        parser = MIPSParser()
+        instructions = parser.parse("nop\nend: addi $t0, $t0, 1\nj end\n")
+        self.assertEqual(parser.symbol_table, {'end': 1})
+        self.assertEqual(instructions[-1].address, '4')
+
+    def test_references_are_not_definitions(self):
+        parser = MIPSParser()
+        parser.parse("main: jal fib\nbeq $t0, $zero, fib\nfib: nop\n")
+        self.assertEqual(parser.symbol_table, {'main': 0, 'fib': 2})
+
+    def test_undefined_label(self):
+        with self.assertRaisesRegex(ParserError, "Undefined label: nowhere at line 2"):
+            MIPSParser().parse("nop\nj nowhere\n")
+
+if __name__ == '__main__':
+    unittest.main()
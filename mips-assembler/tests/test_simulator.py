@@ -0,0 +1,120 @@
+import unittest
+
+from mips_assembler.encoder import MIPSEncoder
+from mips_assembler.parser import MIPSParser
+from mips_assembler.simulator import MIPSSimulator, SimulatorError
+
+def assemble(code):
+    """Assemble source text into machine code words"""
+    return MIPSEncoder().encode(MIPSParser().parse(code))
+
+class TestRun(unittest.TestCase):
+    """Tests for running programs to completion or to the step limit"""
+
+    def test_halts_when_pc_leaves_program(self):
+        simulator = MIPSSimulator(assemble("addi $t0, $zero, 3\nsw $t0, 0($gp)\nlw $t1, 0($gp)\n"))
+        self.assertEqual(simulator.run(), 3)
+        self.assertTrue(simulator.halted)
+        self.assertEqual(simulator.registers[9], 3)
+
+    def test_step_limit_is_not_a_halt(self):
+        simulator = MIPSSimulator(assemble("loop: addi $t0, $t0, 1\nj loop\n"))
+        self.assertEqual(simulator.run(max_steps=10), 10)
+        self.assertFalse(simulator.halted)
+        self.assertEqual(simulator.pc, 0)
+
+class TestControlFlow(unittest.TestCase):
+    """Tests for branches, jumps, calls and returns"""
+
+    def test_call_and_return(self):
+        simulator = MIPSSimulator(assemble(
+            "main:   addi $a0, $zero, 5\n"
+            "        jal double\n"
+            "        addi $s0, $v0, 0\n"
+            "        j end\n"
+            "double: add $v0, $a0, $a0\n"
+            "        jr $ra\n"
+            "end:    nop\n"))
+        self.assertEqual(simulator.run(), 7)
+        self.assertTrue(simulator.halted)
+        self.assertEqual(simulator.registers[31], 0x08)  # $ra: the word after jal
+        self.assertEqual(simulator.registers[16], 10)    # $s0
+
+    def test_branches(self):
+        simulator = MIPSSimulator(assemble(
+            "      addi $t0, $zero, 3\n"
+            "loop: addi $t1, $t1, 1\n"
+            "      addi $t0, $t0, -1\n"
+            "      bne $t0, $zero, loop\n"
+            "      beq $t1, $zero, skip\n"
+            "      beq $t0, $zero, skip\n"
+            "      addi $t2, $zero, 99\n"
+            "skip: nop\n"))
+        # 1 + 3 loop iterations of 3 + untaken beq + taken beq + nop
+        self.assertEqual(simulator.run(), 13)
+        self.assertEqual(simulator.registers[9], 3)   # $t1
+        self.assertEqual(simulator.registers[10], 0)  # $t2 skipped
+
+    def test_data_accesses_are_observed(self):
+        accesses = []
+
+        class Recorder:
+            def fetch(self, pc):
+                pass
+
+            def data_access(self, pc, address, is_store):
+                accesses.append((pc, address, is_store))
+
+        MIPSSimulator(assemble("sw $ra, -4($sp)\nlw $t0, -4($sp)\n")).run(Recorder())
+        top = MIPSSimulator.STACK_POINTER - 4
+        self.assertEqual(accesses, [(0x0, top, True), (0x4, top, False)])
+
+class TestArithmetic(unittest.TestCase):
+    """Tests for signed comparison and shifts"""
+
+    def test_slt_is_signed(self):
+        simulator = MIPSSimulator(assemble(
+            "addi $t0, $zero, -1\n"
+            "slt $t1, $t0, $zero\n"
+            "slt $t2, $zero, $t0\n"))
+        simulator.run()
+        self.assertEqual(simulator.registers[8], 0xFFFFFFFF)
+        self.assertEqual(simulator.registers[9], 1)
+        self.assertEqual(simulator.registers[10], 0)
+
+    def test_shifts(self):
+        simulator = MIPSSimulator(assemble(
+            "addi $t0, $zero, -1\n"
+            "srl $t1, $t0, 28\n"
+            "addi $t2, $zero, 3\n"
+            "sll $t3, $t2, 31\n"
+            "sll $t4, $t2, 2\n"))
+        simulator.run()
+        self.assertEqual(simulator.registers[9], 0xF)          # Logical, not arithmetic
+        self.assertEqual(simulator.registers[11], 0x80000000)  # Truncated to 32 bits
+        self.assertEqual(simulator.registers[12], 12)
+
+    def test_zero_register_is_not_written(self):
+        simulator = MIPSSimulator(assemble("addi $zero, $zero, 1\nadd $zero, $t0, $t0\n"))
+        simulator.run()
+        self.assertEqual(simulator.registers[0], 0)
+
+class TestErrors(unittest.TestCase):
+    """Tests for SimulatorError paths"""
+
+    def test_unaligned_access(self):
+        simulator = MIPSSimulator(assemble("nop\nlw $t0, 2($gp)\n"))
+        with self.assertRaisesRegex(SimulatorError,
+                                    "Unaligned memory access: 0x10008002 at address 0x00000004"):
+            simulator.run()
+
+    def test_unknown_opcode(self):
+        with self.assertRaisesRegex(SimulatorError, "Unknown opcode: 0x3F at address 0x00000000"):
+            MIPSSimulator([0xFC000000]).run()
+
+    def test_unknown_function_code(self):
+        with self.assertRaisesRegex(SimulatorError, "Unknown function code: 0x3F"):
+            MIPSSimulator([0x0000003F]).run()
+
+if __name__ == '__main__':
+    unittest.main()